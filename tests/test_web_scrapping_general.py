@@ -0,0 +1,124 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import web_scrapping_general as scraper
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+class FakeResponse:
+    def __init__(self, content, encoding="utf-8"):
+        self.status_code = 200
+        self.content = content
+        self.encoding = encoding
+
+
+@pytest.fixture
+def scrape(monkeypatch):
+    # Serve a fixture instead of the network and return (restaurant data, path counts)
+    counts = {"structured_data": 0, "full_soup": 0}
+    monkeypatch.setattr(scraper, "parse_path_counts", counts)
+
+    def run(name, encoding="utf-8"):
+        monkeypatch.setattr(scraper.requests, "get", lambda *args, **kwargs: FakeResponse(load_fixture(name), encoding))
+        return scraper.scrape_restaurant({"name": name, "url": "https://example.com/"}), counts
+
+    return run
+
+
+def test_jsonld_restaurant_menu():
+    data = scraper.extract_structured_data(load_fixture("jsonld_restaurant.html"))
+
+    assert data["title"] == "Bresca Dining"
+    assert data["contact_info"] == {
+        "address": "1906 14th St NW, Washington, DC 20009",
+        "phone": "+1 202-518-7926",
+        "email": "info@bresca.example",
+        "hours": "Tuesday: 17:00-22:00"
+    }
+    # The @id diet reference and the empty name list must not drop their siblings
+    assert [item["item"] for item in data["menu_items"]] == ["Sea Urchin", "Garden Salad", ""]
+    assert [item["price"] for item in data["menu_items"]] == ["$18.00", "$12", "$14"]
+    assert data["menu_items"][0]["currency"] == "USD"
+    assert data["menu_items"][1]["vegetarian"] is True
+    assert data["menu_items"][2]["description"] == "Chef's choice"
+    assert all(item["section"] == "Starters" for item in data["menu_items"])
+
+
+def test_jsonld_graph():
+    data = scraper.extract_structured_data(load_fixture("jsonld_graph.html"))
+
+    assert data["contact_info"]["address"] == "Upper Level, Overseas Passenger Terminal, The Rocks NSW 2000"
+    assert data["contact_info"]["phone"] == "+61 2 9251 5600"
+    assert data["contact_info"]["hours"] == "Fr-Su 12:00-15:00, Tu-Su 18:00-22:00"
+    assert [(item["item"], item["price"], item["currency"]) for item in data["menu_items"]] == [
+        ("Snow Egg", "$35", "AUD"),
+        ("Mud Crab Congee", "$52", "AUD")
+    ]
+    assert data["menu_items"][1]["gluten_free"] is True
+
+
+def test_microdata_with_omitted_end_tags():
+    html = load_fixture("microdata_omitted_end_tags.html")
+    parser = scraper.StructuredDataParser()
+    parser.feed(html.decode("utf-8"))
+    parser.close()
+    restaurant = parser.microdata[0]
+
+    assert restaurant["@type"] == ["Restaurant", "Place"]
+    assert restaurant["description"] == "Famous kebabs"
+    assert restaurant["url"] == "https://www.tundaykababi.example/"
+
+    data = scraper.extract_structured_data(html)
+    assert data["contact_info"] == {
+        "address": "Aminabad, Lucknow,  ",
+        "phone": "+91 522 000 0000",
+        "email": "hello@tundaykababi.example",
+        "hours": "Mo-Su 10:00-23:00"
+    }
+    # The second <li> closes the first instead of nesting inside it
+    assert [(item["item"], item["price"]) for item in data["menu_items"]] == [
+        ("Galouti Kebab", "$250"),
+        ("Veg Biryani", "$180")
+    ]
+
+
+def test_messy_prices():
+    data = scraper.extract_structured_data(load_fixture("messy_prices.html"))
+
+    assert [item["price"] for item in data["menu_items"]] == ["$9", "$9.50", "$1200.00", "$1234.50", "Not found"]
+    assert data["menu_items"][1]["currency"] == "EUR"
+    assert "currency" not in data["menu_items"][4]
+
+
+def test_unknown_charset_falls_back_to_utf8():
+    data = scraper.extract_structured_data(load_fixture("jsonld_graph.html"), "bogus-charset")
+
+    assert data["title"] == "Quay"
+
+
+@pytest.mark.parametrize("name", ["jsonld_restaurant.html", "jsonld_graph.html", "microdata_omitted_end_tags.html"])
+def test_complete_structured_data_skips_soup(scrape, name):
+    result, counts = scrape(name)
+
+    assert "error" not in result
+    assert counts == {"structured_data": 1, "full_soup": 0}
+
+
+def test_missing_fields_fall_back_to_soup(scrape):
+    result, counts = scrape("messy_prices.html", encoding="bogus-charset")
+
+    assert counts == {"structured_data": 0, "full_soup": 1}
+    assert result["contact_info"]["address"] == "Find us at 12 George Street, Sydney"
+    assert result["contact_info"]["phone"] == "202-555-0143"
+    assert result["contact_info"]["hours"] == "Opening hours: Monday to Friday 9am-5pm"
+    assert result["price_range"] == {"min": 9.0, "max": 1234.5}
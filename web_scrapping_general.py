@@ -6,6 +6,7 @@ import time
 import random
 import re
 import os
+from html.parser import HTMLParser
 
 # List of restaurant websites to scrape
 restaurant_urls = [
@@ -113,85 +114,89 @@ def extract_menu_items(soup):
     
     return menu_items
 
+# Keyword sweeps used when structured data is missing, compiled once instead of per loop
+ADDRESS_KEYWORDS = re.compile(r'address|location|find us|directions', re.I)
+PHONE_KEYWORDS = re.compile(r'phone|call|tel|contact', re.I)
+HOURS_KEYWORDS = re.compile(r'hours|open|opening|time', re.I)
+STREET_REGEX = re.compile(r'\d+.*(?:street|st\.|avenue|ave\.|road|rd\.|blvd|boulevard)', re.I)
+PHONE_REGEX = re.compile(r'(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+DAY_REGEX = re.compile(r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)', re.I)
+
+BUSINESS_TYPES = {"Restaurant", "LocalBusiness", "FoodEstablishment"}
+
+# Function to read a single schema.org value as text
+# Repeated properties arrive as lists, references as {"@id": ...} and typed literals as {"@value": ...}
+def schema_text(value):
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        value = value.get("@id", value.get("@value", ""))
+    return "" if value is None else str(value)
+
+# Function to read the @type of a schema.org node (may be a string or a list)
+def schema_types(node):
+    node_type = node.get("@type", [])
+    return {schema_text(t) for t in (node_type if isinstance(node_type, list) else [node_type])}
+
+# Function to copy contact fields from a schema.org Restaurant/LocalBusiness node
+def apply_business_schema(data, contact_info):
+    if not BUSINESS_TYPES & schema_types(data):
+        return
+    if "address" in data:
+        address_data = data["address"]
+        if isinstance(address_data, list) and address_data:
+            address_data = address_data[0]
+        if isinstance(address_data, dict):
+            contact_info["address"] = f"{address_data.get('streetAddress', '')}, {address_data.get('addressLocality', '')}, {address_data.get('addressRegion', '')} {address_data.get('postalCode', '')}"
+        elif isinstance(address_data, str):
+            contact_info["address"] = address_data
+    telephone = schema_text(data.get("telephone", ""))
+    if telephone:
+        contact_info["phone"] = telephone.replace('tel:', '')
+    email = schema_text(data.get("email", ""))
+    if email:
+        contact_info["email"] = email.replace('mailto:', '')
+    if "openingHoursSpecification" in data:
+        hours_data = data["openingHoursSpecification"]
+        hours_text = []
+        for hours in hours_data if isinstance(hours_data, list) else [hours_data]:
+            if not isinstance(hours, dict):
+                continue
+            day = hours.get("dayOfWeek", "")
+            day = ", ".join(schema_text(d) for d in day) if isinstance(day, list) else schema_text(day)
+            opens = schema_text(hours.get("opens", ""))
+            closes = schema_text(hours.get("closes", ""))
+            hours_text.append(f"{day}: {opens}-{closes}")
+        if hours_text:
+            contact_info["hours"] = ", ".join(hours_text)
+    elif "openingHours" in data:
+        hours_data = data["openingHours"]
+        hours_text = ", ".join(schema_text(h) for h in hours_data) if isinstance(hours_data, list) else schema_text(hours_data)
+        if hours_text:
+            contact_info["hours"] = hours_text
+
 # Function to extract contact information and hours
-def extract_contact_info(soup, url):
-    contact_info = {
-        "address": "Not found",
-        "phone": "Not found",
-        "email": "Not found",
-        "hours": "Not found"
-    }
-    
-    # Look for address using common patterns
-    address_patterns = ['address', 'location', 'find us', 'directions']
-    phone_patterns = ['phone', 'call', 'tel', 'contact']
-    hours_patterns = ['hours', 'open', 'opening', 'time']
-    
-    # Check for structured data (JSON-LD)
-    script_tags = soup.find_all('script', type='application/ld+json')
-    for script in script_tags:
-        try:
-            data = json.loads(script.string)
-            # Check if it's a local business or restaurant schema
-            if isinstance(data, dict):
-                if "@type" in data and data["@type"] in ["Restaurant", "LocalBusiness"]:
-                    if "address" in data:
-                        address_data = data["address"]
-                        contact_info["address"] = f"{address_data.get('streetAddress', '')}, {address_data.get('addressLocality', '')}, {address_data.get('addressRegion', '')} {address_data.get('postalCode', '')}"
-                    if "telephone" in data:
-                        contact_info["phone"] = data["telephone"]
-                    if "openingHoursSpecification" in data:
-                        hours_data = data["openingHoursSpecification"]
-                        hours_text = []
-                        for hours in hours_data if isinstance(hours_data, list) else [hours_data]:
-                            day = hours.get("dayOfWeek", "")
-                            opens = hours.get("opens", "")
-                            closes = hours.get("closes", "")
-                            hours_text.append(f"{day}: {opens}-{closes}")
-                        contact_info["hours"] = ", ".join(hours_text)
-            # Handle graphs
-            if isinstance(data, dict) and "@graph" in data:
-                for item in data["@graph"]:
-                    if item.get("@type") in ["Restaurant", "LocalBusiness"]:
-                        if "address" in item:
-                            address_data = item["address"]
-                            contact_info["address"] = f"{address_data.get('streetAddress', '')}, {address_data.get('addressLocality', '')}, {address_data.get('addressRegion', '')} {address_data.get('postalCode', '')}"
-                        if "telephone" in item:
-                            contact_info["phone"] = item["telephone"]
-                        if "openingHoursSpecification" in item:
-                            hours_data = item["openingHoursSpecification"]
-                            hours_text = []
-                            for hours in hours_data if isinstance(hours_data, list) else [hours_data]:
-                                day = hours.get("dayOfWeek", "")
-                                opens = hours.get("opens", "")
-                                closes = hours.get("closes", "")
-                                hours_text.append(f"{day}: {opens}-{closes}")
-                            contact_info["hours"] = ", ".join(hours_text)
-        except:
-            continue
+# contact_info comes pre-filled from extract_structured_data; only the missing fields are searched
+def extract_contact_info(soup, url, contact_info):
+    contact_info = dict(contact_info)
     
     # If structured data didn't work, try other methods
     if contact_info["address"] == "Not found":
         # Look for address in paragraphs, spans, or divs
-        for pattern in address_patterns:
-            address_elements = soup.find_all(['p', 'span', 'div'], string=re.compile(pattern, re.I))
-            for element in address_elements:
-                # Look for text that might be an address (contains digits and street-related words)
-                text = element.get_text().strip()
-                if re.search(r'\d+.*(?:street|st\.|avenue|ave\.|road|rd\.|blvd|boulevard)', text, re.I):
-                    contact_info["address"] = text
-                    break
+        for element in soup.find_all(['p', 'span', 'div'], string=ADDRESS_KEYWORDS):
+            # Look for text that might be an address (contains digits and street-related words)
+            text = element.get_text().strip()
+            if STREET_REGEX.search(text):
+                contact_info["address"] = text
+                break
     
     # Look for phone numbers
     if contact_info["phone"] == "Not found":
-        phone_regex = r'(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'
-        for pattern in phone_patterns:
-            phone_elements = soup.find_all(['p', 'span', 'div', 'a'], string=re.compile(pattern, re.I))
-            for element in phone_elements:
-                matches = re.search(phone_regex, element.get_text())
-                if matches:
-                    contact_info["phone"] = matches.group(0)
-                    break
+        for element in soup.find_all(['p', 'span', 'div', 'a'], string=PHONE_KEYWORDS):
+            matches = PHONE_REGEX.search(element.get_text())
+            if matches:
+                contact_info["phone"] = matches.group(0)
+                break
         
         # Also check for tel: links
         tel_links = soup.find_all('a', href=re.compile(r'^tel:'))
@@ -199,23 +204,336 @@ def extract_contact_info(soup, url):
             contact_info["phone"] = tel_links[0]['href'].replace('tel:', '')
     
     # Look for email
-    email_links = soup.find_all('a', href=re.compile(r'^mailto:'))
-    if email_links and len(email_links) > 0:
-        contact_info["email"] = email_links[0]['href'].replace('mailto:', '')
+    if contact_info["email"] == "Not found":
+        email_links = soup.find_all('a', href=re.compile(r'^mailto:'))
+        if email_links and len(email_links) > 0:
+            contact_info["email"] = email_links[0]['href'].replace('mailto:', '')
     
     # Look for hours
     if contact_info["hours"] == "Not found":
-        for pattern in hours_patterns:
-            hours_elements = soup.find_all(['p', 'div', 'span'], string=re.compile(pattern, re.I))
-            for element in hours_elements:
-                # Check if the text contains day names (likely hours)
-                text = element.get_text().strip()
-                if re.search(r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)', text, re.I):
-                    contact_info["hours"] = text
-                    break
+        for element in soup.find_all(['p', 'div', 'span'], string=HOURS_KEYWORDS):
+            # Check if the text contains day names (likely hours)
+            text = element.get_text().strip()
+            if DAY_REGEX.search(text):
+                contact_info["hours"] = text
+                break
     
     return contact_info
 
+# Elements that never get an end tag, so they must be closed as soon as they open
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'}
+
+# Start tags that implicitly close an open <p> (HTML parsing rules)
+P_CLOSING_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'details', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'menu', 'nav',
+    'ol', 'p', 'pre', 'section', 'table', 'ul'
+}
+
+# Elements an open <p>/<li>/<dd>/<dt> cannot be implicitly closed across
+SCOPE_BOUNDARY_TAGS = {'applet', 'button', 'caption', 'html', 'marquee', 'object', 'table', 'td', 'template', 'th'}
+
+# Start tag -> (open tags it implicitly closes, open tags that stop the search)
+IMPLIED_END_TAGS = {
+    'li': ({'li'}, SCOPE_BOUNDARY_TAGS | {'ol', 'ul'}),
+    'dd': ({'dd', 'dt'}, SCOPE_BOUNDARY_TAGS | {'dl'}),
+    'dt': ({'dd', 'dt'}, SCOPE_BOUNDARY_TAGS | {'dl'}),
+    'tr': ({'tr', 'td', 'th'}, {'table', 'tbody', 'thead', 'tfoot'}),
+    'td': ({'td', 'th'}, {'tr', 'table'}),
+    'th': ({'td', 'th'}, {'tr', 'table'}),
+    'tbody': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, {'table'}),
+    'thead': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, {'table'}),
+    'tfoot': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, {'table'}),
+    'option': ({'option'}, {'select', 'datalist', 'optgroup'}),
+    'optgroup': ({'option', 'optgroup'}, {'select', 'datalist'}),
+}
+
+# Attribute holding an itemprop value for elements whose value is not their text
+MICRODATA_VALUE_ATTRS = {
+    'meta': 'content',
+    'a': 'href', 'area': 'href', 'link': 'href',
+    'audio': 'src', 'embed': 'src', 'iframe': 'src', 'img': 'src', 'source': 'src', 'video': 'src',
+    'object': 'data',
+    'time': 'datetime',
+    'data': 'value', 'meter': 'value'
+}
+
+# Streaming tokenizer that collects JSON-LD, microdata, tel:/mailto: links and the title without building a DOM
+class StructuredDataParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.json_ld = []
+        self.microdata = []
+        self.title = None
+        self.tel_links = []
+        self.mailto_links = []
+        self._open = []  # one entry per open element: [tag, item, prop, parent_item, text]
+        self._items = []  # stack of microdata items currently in scope
+        self._script = None
+        self._in_raw_text = False  # inside a non JSON-LD <script> or a <style>
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'script':
+            if (attrs.get('type') or '').strip().lower() == 'application/ld+json':
+                self._script = []
+            else:
+                self._in_raw_text = True
+            return
+        if tag == 'style':
+            self._in_raw_text = True
+            return
+        if tag == 'title' and self.title is None:
+            self._in_title = True
+            self.title = ''
+        if tag == 'a' and attrs.get('href'):
+            href = attrs['href'].strip()
+            if href.startswith('tel:'):
+                self.tel_links.append(href.replace('tel:', ''))
+            elif href.startswith('mailto:'):
+                self.mailto_links.append(href.replace('mailto:', ''))
+
+        self._close_implied(tag)
+        parent_item = self._items[-1] if self._items else None
+        prop = attrs.get('itemprop')
+        item = None
+        text = None
+        if 'itemscope' in attrs:
+            # A nested item ends any text property still collecting (e.g. an unclosed <p itemprop=...>)
+            for entry in self._open:
+                if entry[4] is not None:
+                    self._add_property(entry[3], entry[2], ' '.join(''.join(entry[4]).split()))
+                    entry[2] = None
+                    entry[4] = None
+            item = {}
+            item_type = attrs.get('itemtype')
+            if item_type:
+                # itemtype may list several type URLs
+                item["@type"] = [url.rstrip('/').rsplit('/', 1)[-1] for url in item_type.split()]
+            if not prop or parent_item is None:
+                self.microdata.append(item)
+            self._items.append(item)
+        elif prop and parent_item is not None:
+            value_attr = MICRODATA_VALUE_ATTRS.get(tag)
+            if 'content' in attrs:
+                self._add_property(parent_item, prop, attrs['content'])
+                prop = None
+            elif value_attr and value_attr in attrs:
+                self._add_property(parent_item, prop, attrs[value_attr])
+                prop = None
+            else:
+                text = []
+
+        entry = [tag, item, prop, parent_item, text]
+        if tag in VOID_TAGS:
+            self._close(entry)
+        else:
+            self._open.append(entry)
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            if self._script is not None:
+                self.json_ld.append(''.join(self._script))
+                self._script = None
+            self._in_raw_text = False
+            return
+        if tag == 'title':
+            self._in_title = False
+        if tag in VOID_TAGS:
+            return
+        # Tolerate sloppy markup: close everything up to the matching open tag, ignore stray end tags
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index][0] == tag:
+                self._close_from(index)
+                break
+
+    def handle_data(self, data):
+        if self._script is not None:
+            self._script.append(data)
+            return
+        if self._in_raw_text:
+            return
+        if self._in_title:
+            self.title += data
+        for entry in self._open:
+            if entry[4] is not None:
+                entry[4].append(data)
+
+    def close(self):
+        super().close()
+        while self._open:
+            self._close(self._open.pop())
+
+    def _close_implied(self, tag):
+        # Close elements whose end tag HTML lets authors omit, e.g. <li>A<li>B
+        rules = []
+        if tag in P_CLOSING_TAGS:
+            rules.append(({'p'}, SCOPE_BOUNDARY_TAGS))
+        if tag in IMPLIED_END_TAGS:
+            rules.append(IMPLIED_END_TAGS[tag])
+        for closes, boundaries in rules:
+            for index in range(len(self._open) - 1, -1, -1):
+                open_tag = self._open[index][0]
+                if open_tag in closes:
+                    self._close_from(index)
+                    break
+                if open_tag in boundaries:
+                    break
+
+    def _close_from(self, index):
+        while len(self._open) > index:
+            self._close(self._open.pop())
+
+    def _close(self, entry):
+        tag, item, prop, parent_item, text = entry
+        if item is not None:
+            self._items.pop()
+            if prop and parent_item is not None:
+                self._add_property(parent_item, prop, item)
+        elif text is not None:
+            self._add_property(parent_item, prop, ' '.join(''.join(text).split()))
+
+    @staticmethod
+    def _add_property(item, prop, value):
+        # itemprop may name several properties at once, and repeated properties become lists
+        for name in prop.split():
+            if name not in item:
+                item[name] = value
+            elif isinstance(item[name], list):
+                item[name].append(value)
+            else:
+                item[name] = [item[name], value]
+
+# Function to flatten parsed JSON-LD (single node, list of nodes or @graph) into schema.org nodes
+def iter_schema_nodes(data):
+    if isinstance(data, list):
+        for entry in data:
+            yield from iter_schema_nodes(entry)
+    elif isinstance(data, dict):
+        if "@graph" in data:
+            yield from iter_schema_nodes(data["@graph"])
+        if "@type" in data:
+            yield data
+
+# Function to reduce a schema.org price ("From $9", "9,50", "1,200.00") to "$<amount>"
+# Every amount is labelled "$" so the price range calculation can parse it; the real currency is kept separately
+def schema_price(raw_price):
+    amount = re.search(r'\d+(?:[.,]\d+)*', schema_text(raw_price))
+    if not amount:
+        return "Not found"
+    amount = amount.group(0)
+    if ',' in amount and '.' in amount and amount.rfind(',') > amount.rfind('.'):
+        # 1.234,50
+        amount = amount.replace('.', '').replace(',', '.')
+    else:
+        # Drop thousands separators (1,200 / 1,200.50), then read any remaining comma as the decimal point (9,50)
+        amount = re.sub(r',(?=\d{3}(?:[.,]|$))', '', amount).replace(',', '.')
+    if not re.fullmatch(r'\d+(?:\.\d+)?', amount):
+        return "Not found"
+    return f"${amount}"
+
+# Function to convert a schema.org MenuItem into the same shape extract_menu_items produces
+def schema_menu_item(node, section=None):
+    name = schema_text(node.get("name", ""))
+    description = schema_text(node.get("description", ""))
+
+    offers = node.get("offers", {})
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    if not isinstance(offers, dict):
+        offers = {}
+    # AggregateOffer gives a lowPrice instead of a price
+    raw_price = offers.get("price", offers.get("lowPrice", node.get("price")))
+    price = schema_price(raw_price)
+    currency = schema_text(offers.get("priceCurrency", ""))
+
+    diets = node.get("suitableForDiet", [])
+    diets = " ".join(schema_text(d) for d in (diets if isinstance(diets, list) else [diets])).lower()
+    item_text = f"{name} {description}".strip()
+
+    menu_item = {
+        "item": name,
+        "price": price,
+        "description": item_text,
+        "vegetarian": "vegetariandiet" in diets or any(v in item_text.lower() for v in ["vegetarian", "veg", "plant-based", "meatless"]),
+        "vegan": "vegandiet" in diets or "vegan" in item_text.lower(),
+        "gluten_free": "glutenfreediet" in diets or any(g in item_text.lower() for g in ["gluten-free", "gluten free", "gf"]),
+        "spicy": any(s in item_text.lower() for s in ["spicy", "hot", "chili"])
+    }
+    if section:
+        menu_item["section"] = section
+    if currency and price != "Not found":
+        menu_item["currency"] = currency
+    return menu_item
+
+# Function to walk Restaurant -> Menu -> MenuSection -> MenuItem and collect the items
+def collect_schema_menu(node, menu_items, section=None):
+    if not isinstance(node, dict):
+        return
+    # A malformed node only loses itself, not its siblings
+    try:
+        types = schema_types(node)
+        if "MenuItem" in types:
+            menu_items.append(schema_menu_item(node, section))
+            return
+        if "MenuSection" in types and schema_text(node.get("name", "")):
+            section = schema_text(node["name"])
+    except Exception:
+        return
+    for key in ("hasMenu", "menu", "hasMenuSection", "hasMenuItem"):
+        children = node.get(key, [])
+        for child in children if isinstance(children, list) else [children]:
+            collect_schema_menu(child, menu_items, section)
+
+# Function to extract contact info, hours and menu from JSON-LD and microdata in the raw page
+def extract_structured_data(raw_html, encoding=None):
+    if isinstance(raw_html, bytes):
+        # Same fallback as requests' response.text when the server names an unknown charset
+        try:
+            raw_html = raw_html.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            raw_html = raw_html.decode('utf-8', errors='replace')
+
+    parser = StructuredDataParser()
+    parser.feed(raw_html)
+    parser.close()
+
+    nodes = []
+    for script in parser.json_ld:
+        try:
+            nodes.extend(iter_schema_nodes(json.loads(script)))
+        except ValueError:
+            continue
+    nodes.extend(parser.microdata)
+
+    contact_info = {
+        "address": "Not found",
+        "phone": "Not found",
+        "email": "Not found",
+        "hours": "Not found"
+    }
+    menu_items = []
+    for node in nodes:
+        # Contact and menu extraction are isolated so a bad contact field cannot drop the node's menu
+        try:
+            apply_business_schema(node, contact_info)
+        except Exception:
+            pass
+        collect_schema_menu(node, menu_items)
+
+    # tel:/mailto: links are the same fallback the soup path would use, so take them here
+    if contact_info["phone"] == "Not found" and parser.tel_links:
+        contact_info["phone"] = parser.tel_links[0]
+    if contact_info["email"] == "Not found" and parser.mailto_links:
+        contact_info["email"] = parser.mailto_links[0]
+
+    title = parser.title.strip() if parser.title else None
+    return {"title": title, "contact_info": contact_info, "menu_items": menu_items}
+
+# How often each parsing path was taken, reported after the scrape
+parse_path_counts = {"structured_data": 0, "full_soup": 0}
+
 # Function to scrape restaurant data
 def scrape_restaurant(restaurant_dict):
     name = restaurant_dict["name"]
@@ -232,17 +550,33 @@ def scrape_restaurant(restaurant_dict):
         response = requests.get(url, headers=headers, timeout=10)
         
         if response.status_code == 200:
-            # Parse HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Fast path: read JSON-LD and microdata straight from the raw bytes
+            structured = extract_structured_data(response.content, response.encoding)
+            title = structured["title"] or "No title found"
+            menu_items = structured["menu_items"]
+            contact_info = structured["contact_info"]
             
-            # Extract restaurant metadata
-            title = soup.title.string if soup.title else "No title found"
-            
-            # Extract menu items
-            menu_items = extract_menu_items(soup)
-            
-            # Extract contact information
-            contact_info = extract_contact_info(soup, url)
+            # Only build the full soup when structured data left fields missing
+            # (email is not checked: the soup would only look at mailto: links, which are already covered)
+            missing = not menu_items or any(contact_info[field] == "Not found" for field in ["address", "phone", "hours"])
+            if missing:
+                parse_path_counts["full_soup"] += 1
+                
+                # Parse HTML content
+                soup = BeautifulSoup(response.content, 'html.parser', from_encoding=response.encoding)
+                
+                # Extract restaurant metadata
+                if not structured["title"]:
+                    title = soup.title.string if soup.title else "No title found"
+                
+                # Extract menu items
+                if not menu_items:
+                    menu_items = extract_menu_items(soup)
+                
+                # Extract contact information
+                contact_info = extract_contact_info(soup, url, contact_info)
+            else:
+                parse_path_counts["structured_data"] += 1
             
             # Calculate price range
             prices = [float(item["price"].replace("$", "")) for item in menu_items 
@@ -278,67 +612,69 @@ def scrape_restaurant(restaurant_dict):
     except Exception as e:
         return {"name": name, "url": url, "error": f"Exception: {str(e)}"}
 
-# Scrape data from all restaurants
-results = []
-for restaurant in restaurant_urls:
-    data = scrape_restaurant(restaurant)
-    results.append(data)
-    # Be respectful with delay between requests
-    time.sleep(random.uniform(2, 4))
-
-# Display basic results summary
-summary = []
-for restaurant in results:
-    if "error" in restaurant:
-        summary.append({
-            "name": restaurant["name"],
-            "url": restaurant["url"],
-            "status": "Error",
-            "error": restaurant["error"]
-        })
-    else:
-        summary.append({
-            "name": restaurant["name"],
-            "url": restaurant["url"],
-            "status": "Success",
-            "menu_items_found": restaurant["item_count"],
-            "price_range": f"${restaurant['price_range']['min']} - ${restaurant['price_range']['max']}" if restaurant['price_range']['max'] > 0 else "Not found",
-            "vegetarian_items": restaurant["dietary_options"]["vegetarian_count"],
-            "contact_info": "✓" if restaurant["contact_info"]["address"] != "Not found" or restaurant["contact_info"]["phone"] != "Not found" else "✗"
-        })
-
-# Display summary table
-summary_df = pd.DataFrame(summary)
-print(summary_df)
-
-# Save the data to JSON
-if not os.path.exists('data'):
-    os.makedirs('data')
-
-# Save the restaurant data
-with open('data/restaurant_data.json', 'w') as f:
-    json.dump(results, f, indent=2)
-print("\nSaved restaurant data to data/restaurant_data.json")
-
-# Print detailed sample of first restaurant with menu items
-print("\nDetailed sample of first restaurant's menu items:")
-for restaurant in results:
-    if "menu_items" in restaurant and len(restaurant["menu_items"]) > 0:
-        print(f"\n{restaurant['name']} Menu Sample:")
-        sample_items = restaurant["menu_items"][:3] if len(restaurant["menu_items"]) > 3 else restaurant["menu_items"]
-        for i, item in enumerate(sample_items):
-            print(f"{i+1}. {item.get('item', 'Unnamed item')}")
-            print(f"   Price: {item.get('price', 'Not found')}")
-            print(f"   Dietary: {'Vegetarian ' if item.get('vegetarian', False) else ''}{'Vegan ' if item.get('vegan', False) else ''}{'Gluten-free ' if item.get('gluten_free', False) else ''}{'Spicy' if item.get('spicy', False) else 'None specified'}")
+if __name__ == "__main__":
+    # Scrape data from all restaurants
+    results = []
+    for restaurant in restaurant_urls:
+        data = scrape_restaurant(restaurant)
+        results.append(data)
+        # Be respectful with delay between requests
+        time.sleep(random.uniform(2, 4))
+
+    # Display basic results summary
+    summary = []
+    for restaurant in results:
+        if "error" in restaurant:
+            summary.append({
+                "name": restaurant["name"],
+                "url": restaurant["url"],
+                "status": "Error",
+                "error": restaurant["error"]
+            })
+        else:
+            summary.append({
+                "name": restaurant["name"],
+                "url": restaurant["url"],
+                "status": "Success",
+                "menu_items_found": restaurant["item_count"],
+                "price_range": f"${restaurant['price_range']['min']} - ${restaurant['price_range']['max']}" if restaurant['price_range']['max'] > 0 else "Not found",
+                "vegetarian_items": restaurant["dietary_options"]["vegetarian_count"],
+                "contact_info": "✓" if restaurant["contact_info"]["address"] != "Not found" or restaurant["contact_info"]["phone"] != "Not found" else "✗"
+            })
+
+    # Display summary table
+    summary_df = pd.DataFrame(summary)
+    print(summary_df)
+    print(f"\nParsing paths: {parse_path_counts['structured_data']} structured data only, {parse_path_counts['full_soup']} full HTML parse")
+
+    # Save the data to JSON
+    if not os.path.exists('data'):
+        os.makedirs('data')
+
+    # Save the restaurant data
+    with open('data/restaurant_data.json', 'w') as f:
+        json.dump(results, f, indent=2)
+    print("\nSaved restaurant data to data/restaurant_data.json")
+
+    # Print detailed sample of first restaurant with menu items
+    print("\nDetailed sample of first restaurant's menu items:")
+    for restaurant in results:
+        if "menu_items" in restaurant and len(restaurant["menu_items"]) > 0:
+            print(f"\n{restaurant['name']} Menu Sample:")
+            sample_items = restaurant["menu_items"][:3] if len(restaurant["menu_items"]) > 3 else restaurant["menu_items"]
+            for i, item in enumerate(sample_items):
+                print(f"{i+1}. {item.get('item', 'Unnamed item')}")
+                print(f"   Price: {item.get('price', 'Not found')}")
+                print(f"   Dietary: {'Vegetarian ' if item.get('vegetarian', False) else ''}{'Vegan ' if item.get('vegan', False) else ''}{'Gluten-free ' if item.get('gluten_free', False) else ''}{'Spicy' if item.get('spicy', False) else 'None specified'}")
         
-        print(f"\n{restaurant['name']} Contact Information:")
-        for key, value in restaurant["contact_info"].items():
-            print(f"- {key.capitalize()}: {value}")
-        print(f"Total Menu Items: {restaurant['item_count']}")
-        print(f"Price Range: ${restaurant['price_range']['min']} - ${restaurant['price_range']['max']}" if restaurant['price_range']['max'] > 0 else "Price Range: Not found")
-        print(f"Dietary Options:")
-        print(f"- Vegetarian Items: {restaurant['dietary_options']['vegetarian_count']}")
-        print(f"- Vegan Items: {restaurant['dietary_options']['vegan_count']}")
-        print(f"- Gluten-free Items: {restaurant['dietary_options']['gluten_free_count']}")
-        print(f"- Spicy Items: {restaurant['dietary_options']['spicy_count']}")
-        break
\ No newline at end of file
+            print(f"\n{restaurant['name']} Contact Information:")
+            for key, value in restaurant["contact_info"].items():
+                print(f"- {key.capitalize()}: {value}")
+            print(f"Total Menu Items: {restaurant['item_count']}")
+            print(f"Price Range: ${restaurant['price_range']['min']} - ${restaurant['price_range']['max']}" if restaurant['price_range']['max'] > 0 else "Price Range: Not found")
+            print(f"Dietary Options:")
+            print(f"- Vegetarian Items: {restaurant['dietary_options']['vegetarian_count']}")
+            print(f"- Vegan Items: {restaurant['dietary_options']['vegan_count']}")
+            print(f"- Gluten-free Items: {restaurant['dietary_options']['gluten_free_count']}")
+            print(f"- Spicy Items: {restaurant['dietary_options']['spicy_count']}")
+            break
\ No newline at end of file